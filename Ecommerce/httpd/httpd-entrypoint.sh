@@ -0,0 +1,15 @@
+#!/bin/sh
+# httpd-entrypoint.sh - generated by tools/generate_server_configs.py
+# Size the event MPM to the cores this container may use, then start httpd.
+# Every value can be overridden with the matching environment variable.
+set -e
+
+CORES=$(nproc)
+export HTTPD_THREADS_PER_CHILD="${HTTPD_THREADS_PER_CHILD:-64}"
+export HTTPD_SERVER_LIMIT="${HTTPD_SERVER_LIMIT:-$((CORES * 2))}"
+export HTTPD_START_SERVERS="${HTTPD_START_SERVERS:-$CORES}"
+export HTTPD_MAX_REQUEST_WORKERS="${HTTPD_MAX_REQUEST_WORKERS:-$((HTTPD_SERVER_LIMIT * HTTPD_THREADS_PER_CHILD))}"
+export HTTPD_MIN_SPARE_THREADS="${HTTPD_MIN_SPARE_THREADS:-$HTTPD_THREADS_PER_CHILD}"
+export HTTPD_MAX_SPARE_THREADS="${HTTPD_MAX_SPARE_THREADS:-$((HTTPD_THREADS_PER_CHILD * (CORES + 1)))}"
+
+exec httpd-foreground "$@"
@@ -0,0 +1,249 @@
+# build_storefront.py
+"""
+Build a single-file storefront page into separately cacheable assets.
+
+The source index.html keeps everything inline so it can still be opened
+straight from disk. The build:
+
+  * moves the inline <style> blocks into assets/app.<hash>.css
+  * moves the inline <script> into assets/app.<hash>.js (loaded with defer)
+  * moves the `const products = [...]` literal into assets/products.<hash>.json
+    and points the page's CATALOG_URL at it, or, with --catalog-api, drops
+    it and lets the page fetch products per category from the catalog API
+  * minifies CSS/JS (rcssmin/rjsmin when installed, a conservative built-in
+    pass otherwise) and trims the HTML
+  * writes .gz and .br (when the brotli module is installed) siblings for
+    every text file, ready for gzip_static / precompressed serving
+  * copies an img/ directory next to the page, if there is one
+
+Fingerprinted names change only when their content changes, so the web
+server can cache assets/ forever while index.html stays revalidated.
+
+Usage:
+  python tools/build_storefront.py E-CommerceApp2/index.html dist
+  python tools/build_storefront.py E-CommerceApp2/index.html dist \
+      --catalog-api http://localhost:5000/api/catalog/ecommerce2
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import shutil
+import sys
+from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+TEXT_SUFFIXES = {".html", ".css", ".js", ".json", ".svg"}
+
+STYLE_RE = re.compile(r"[ \t]*<style>(.*?)</style>\n?", re.S)
+SCRIPT_RE = re.compile(r"[ \t]*<script>(.*?)</script>\n?", re.S)
+PRODUCTS_RE = re.compile(r"const products = (\[.*?\n\s*\]);", re.S)
+CATALOG_URL_RE = re.compile(r"const CATALOG_URL = null;")
+CATALOG_API_RE = re.compile(r'<meta name="catalog-api" content="">')
+
+
+def minify_css(css):
+    """Minify CSS, preferring rcssmin when it is installed"""
+    if rcssmin is not None:
+        return rcssmin.cssmin(css)
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(js):
+    """Minify JS, preferring rjsmin when it is installed
+
+    The fallback only drops indentation, blank lines and whole-line
+    comments, which is safe for template literals and regex literals.
+    """
+    if rjsmin is not None:
+        return rjsmin.jsmin(js)
+    lines = []
+    for line in js.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("//"):
+            continue
+        lines.append(stripped)
+    return "\n".join(lines)
+
+
+def minify_html(html):
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+
+def js_literal_to_json(literal):
+    """Convert the products array literal (unquoted keys, trailing commas) to data"""
+    quoted = re.sub(r"^(\s*)([A-Za-z_$][\w$]*)\s*:", r'\1"\2":', literal, flags=re.M)
+    quoted = re.sub(r",(\s*[}\]])", r"\1", quoted)
+    return json.loads(quoted)
+
+
+class StorefrontBuilder:
+    def __init__(self, page, out_dir, catalog_api=None):
+        """
+        Initialize the storefront builder
+
+        Args:
+            page: Path to the single-file storefront index.html
+            out_dir: Directory to write the built site to
+            catalog_api: Catalog API base URL; products are then not bundled
+        """
+        self.page = Path(page)
+        self.out_dir = Path(out_dir)
+        self.catalog_api = catalog_api.rstrip("/") if catalog_api else None
+        self.assets_dir = self.out_dir / "assets"
+        self.report = []
+
+    def write_asset(self, stem, suffix, content, original_size):
+        """Write a fingerprinted asset and return its URL relative to the page"""
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()[:10]
+        target = self.assets_dir / f"{stem}.{digest}{suffix}"
+        target.write_bytes(data)
+        self.report.append((target, original_size))
+        return f"assets/{target.name}"
+
+    def build(self):
+        """Split, minify, fingerprint and precompress the page"""
+        print(f"🏗️  Building {self.page}...")
+        if self.out_dir.exists():
+            shutil.rmtree(self.out_dir)
+        self.assets_dir.mkdir(parents=True)
+
+        html = self.page.read_text()
+
+        styles = STYLE_RE.findall(html)
+        scripts = SCRIPT_RE.findall(html)
+        if not styles or not scripts:
+            print("  ✗ Expected inline <style> and <script> blocks")
+            return False
+
+        css = "\n".join(styles)
+        css_url = self.write_asset("app", ".css", minify_css(css), len(css.encode("utf-8")))
+
+        js = "\n".join(scripts)
+        js_size = len(js.encode("utf-8"))
+        match = PRODUCTS_RE.search(js)
+        catalog_url = None
+        if match and self.catalog_api:
+            js = js[:match.start()] + "const products = [];" + js[match.end():]
+            html, count = CATALOG_API_RE.subn(
+                f'<meta name="catalog-api" content="{self.catalog_api}">', html
+            )
+            if not count:
+                print('  ✗ Page has no <meta name="catalog-api" content=""> tag')
+                return False
+            print(f"  ✓ Products will be fetched from {self.catalog_api}")
+        elif match:
+            products = js_literal_to_json(match.group(1))
+            catalog = json.dumps(products, separators=(",", ":"))
+            catalog_url = self.write_asset(
+                "products", ".json", catalog, len(match.group(1).encode("utf-8"))
+            )
+            js = js[:match.start()] + "const products = [];" + js[match.end():]
+            js, count = CATALOG_URL_RE.subn(f"const CATALOG_URL = '{catalog_url}';", js)
+            if not count:
+                print("  ✗ Page has a products literal but no `const CATALOG_URL = null;`")
+                return False
+            print(f"  ✓ Moved {len(products)} products to {catalog_url}")
+        js_url = self.write_asset("app", ".js", minify_js(js), js_size)
+
+        head_links = f'    <link rel="stylesheet" href="{css_url}">\n'
+        if catalog_url:
+            head_links += f'    <link rel="preload" href="{catalog_url}" as="fetch" crossorigin>\n'
+        if self.catalog_api:
+            api = urlsplit(self.catalog_api)
+            head_links += f'    <link rel="preconnect" href="{api.scheme}://{api.netloc}" crossorigin>\n'
+        html = STYLE_RE.sub("", html)
+        html = html.replace("</head>", head_links + "</head>", 1)
+        html = SCRIPT_RE.sub(lambda _: f'    <script src="{js_url}" defer></script>\n', html, count=1)
+        html = SCRIPT_RE.sub("", html)
+
+        index_path = self.out_dir / "index.html"
+        index_path.write_text(minify_html(html))
+        self.report.insert(0, (index_path, len(html.encode("utf-8"))))
+
+        image_dir = self.page.parent / "img"
+        if image_dir.is_dir():
+            shutil.copytree(image_dir, self.out_dir / "img")
+            print(f"  ✓ Copied {image_dir}")
+
+        self.precompress()
+        self.print_report()
+        return True
+
+    def precompress(self):
+        """Write .gz and .br siblings for every text file in the output"""
+        if brotli is None:
+            print("  ⚠️  brotli module not installed, skipping .br files (pip install brotli)")
+        for path in sorted(self.out_dir.rglob("*")):
+            if path.suffix not in TEXT_SUFFIXES:
+                continue
+            data = path.read_bytes()
+            with open(f"{path}.gz", "wb") as f:
+                f.write(gzip.compress(data, compresslevel=9, mtime=0))
+            if brotli is not None:
+                with open(f"{path}.br", "wb") as f:
+                    f.write(brotli.compress(data, quality=11))
+
+    def print_report(self):
+        print(f"\n  {'asset':<36} {'original':>9} {'minified':>9} {'gzip':>8} {'brotli':>8}")
+        total_original = total_gzip = 0
+        for path, original in self.report:
+            minified = path.stat().st_size
+            gz = Path(f"{path}.gz").stat().st_size
+            br_path = Path(f"{path}.br")
+            br = br_path.stat().st_size if br_path.exists() else None
+            total_original += original
+            total_gzip += gz
+            br_column = f"{br:>8,}" if br is not None else f"{'-':>8}"
+            print(f"  {path.relative_to(self.out_dir).as_posix():<36} {original:>9,} {minified:>9,} "
+                  f"{gz:>8,} {br_column}")
+        saved = 100 * (1 - total_gzip / total_original) if total_original else 0
+        print(f"\n  ✓ {total_original:,} bytes -> {total_gzip:,} bytes gzipped ({saved:.0f}% smaller)")
+
+
+def main():
+    """Main function to parse arguments and run the build"""
+    parser = argparse.ArgumentParser(
+        description="Split, minify, fingerprint and precompress a single-file storefront",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s Ecommerce/index.html Ecommerce/dist
+  %(prog)s E-CommerceApp2/index.html /tmp/site
+  %(prog)s Ecommerce/index.html dist --catalog-api http://localhost:5000/api/catalog/ecommerce
+        """
+    )
+    parser.add_argument("page", help="Source index.html")
+    parser.add_argument("out", help="Output directory (replaced on every build)")
+    parser.add_argument("--catalog-api", default=None,
+                        help="Catalog API base URL to fetch products from instead of bundling them")
+    args = parser.parse_args()
+
+    builder = StorefrontBuilder(args.page, args.out, catalog_api=args.catalog_api)
+    if not builder.build():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+# generate_server_configs.py
+"""
+Generate tuned web server configs for the storefront images.
+
+  Ecommerce/httpd/storefront-tuned.conf   event MPM, sendfile, keep-alive,
+                                          precompressed .br/.gz serving,
+                                          immutable caching for assets/
+  Ecommerce/httpd/httpd-entrypoint.sh     sizes the MPM to the container's
+                                          cores at start-up
+  E-CommerceApp2/nginx/nginx.conf         worker_processes auto, sendfile,
+                                          tcp_nopush, keep-alive, gzip_static,
+                                          open_file_cache, immutable assets/
+
+The generated files are committed; re-run this script after changing the
+options below and rebuild the images.
+"""
+import argparse
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class ServerConfigGenerator:
+    def __init__(self, keepalive_timeout=15, keepalive_requests=1000,
+                 worker_connections=4096, threads_per_child=64,
+                 asset_max_age=31536000, image_max_age=604800):
+        """
+        Initialize the config generator
+
+        Args:
+            keepalive_timeout: Seconds an idle keep-alive connection stays open
+            keepalive_requests: Requests served per keep-alive connection
+            worker_connections: nginx connections per worker process
+            threads_per_child: httpd event MPM threads per child process
+            asset_max_age: Cache lifetime for fingerprinted assets/ files
+            image_max_age: Cache lifetime for img/ variants
+        """
+        self.keepalive_timeout = keepalive_timeout
+        self.keepalive_requests = keepalive_requests
+        self.worker_connections = worker_connections
+        self.threads_per_child = threads_per_child
+        self.asset_max_age = asset_max_age
+        self.image_max_age = image_max_age
+
+    def create_httpd_config(self, target_dir):
+        """Create the httpd include file and its entrypoint"""
+        print("🪶 Creating httpd config...")
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        httpd_conf = f'''# storefront-tuned.conf - generated by tools/generate_server_configs.py
+# Included at the end of the stock httpd.conf (see Ecommerce/Dockerfile).
+
+# Event MPM sized from the container's cores by httpd-entrypoint.sh
+<IfModule mpm_event_module>
+    ServerLimit              ${{HTTPD_SERVER_LIMIT}}
+    StartServers             ${{HTTPD_START_SERVERS}}
+    ThreadLimit              ${{HTTPD_THREADS_PER_CHILD}}
+    ThreadsPerChild          ${{HTTPD_THREADS_PER_CHILD}}
+    MaxRequestWorkers        ${{HTTPD_MAX_REQUEST_WORKERS}}
+    MinSpareThreads          ${{HTTPD_MIN_SPARE_THREADS}}
+    MaxSpareThreads          ${{HTTPD_MAX_SPARE_THREADS}}
+    MaxConnectionsPerChild   0
+    AsyncRequestWorkerFactor 2
+</IfModule>
+
+# Zero-copy static file serving and cheap connections
+EnableSendfile On
+EnableMMAP On
+HostnameLookups Off
+Timeout 30
+KeepAlive On
+KeepAliveTimeout {self.keepalive_timeout}
+MaxKeepAliveRequests {self.keepalive_requests}
+FileETag MTime Size
+
+<Directory "/usr/local/apache2/htdocs">
+    # No per-request .htaccess lookups
+    AllowOverride None
+    Options FollowSymLinks
+</Directory>
+
+# Serve the build's precompressed siblings (.br first, then .gz)
+RewriteEngine On
+RewriteCond "%{{HTTP:Accept-Encoding}}" "\\bbr\\b"
+RewriteCond "%{{DOCUMENT_ROOT}}%{{REQUEST_URI}}.br" -s
+RewriteRule "^(.+)\\.(css|js|json|html|svg)$" "$1.$2.br" [QSA]
+RewriteCond "%{{HTTP:Accept-Encoding}}" "gzip"
+RewriteCond "%{{DOCUMENT_ROOT}}%{{REQUEST_URI}}.gz" -s
+RewriteRule "^(.+)\\.(css|js|json|html|svg)$" "$1.$2.gz" [QSA]
+
+RewriteRule "\\.css\\.(br|gz)$"  "-" [T=text/css,E=no-gzip:1,E=no-brotli:1]
+RewriteRule "\\.js\\.(br|gz)$"   "-" [T=text/javascript,E=no-gzip:1,E=no-brotli:1]
+RewriteRule "\\.json\\.(br|gz)$" "-" [T=application/json,E=no-gzip:1,E=no-brotli:1]
+RewriteRule "\\.html\\.(br|gz)$" "-" [T=text/html,E=no-gzip:1,E=no-brotli:1]
+RewriteRule "\\.svg\\.(br|gz)$"  "-" [T=image/svg+xml,E=no-gzip:1,E=no-brotli:1]
+
+<FilesMatch "\\.(css|js|json|html|svg)\\.br$">
+    Header append Content-Encoding br
+    Header append Vary Accept-Encoding
+</FilesMatch>
+<FilesMatch "\\.(css|js|json|html|svg)\\.gz$">
+    Header append Content-Encoding gzip
+    Header append Vary Accept-Encoding
+</FilesMatch>
+
+# On-the-fly compression for anything without a precompressed sibling
+AddOutputFilterByType DEFLATE text/html text/css text/javascript application/javascript application/json image/svg+xml
+
+# Fingerprinted assets never change; the page itself is always revalidated
+<LocationMatch "^/assets/">
+    Header set Cache-Control "public, max-age={self.asset_max_age}, immutable"
+</LocationMatch>
+<LocationMatch "^/img/">
+    Header set Cache-Control "public, max-age={self.image_max_age}"
+</LocationMatch>
+<LocationMatch "^/(index\\.html(\\.br|\\.gz)?)?$">
+    Header set Cache-Control "no-cache"
+</LocationMatch>
+'''
+
+        entrypoint = f'''#!/bin/sh
+# httpd-entrypoint.sh - generated by tools/generate_server_configs.py
+# Size the event MPM to the cores this container may use, then start httpd.
+# Every value can be overridden with the matching environment variable.
+set -e
+
+CORES=$(nproc)
+export HTTPD_THREADS_PER_CHILD="${{HTTPD_THREADS_PER_CHILD:-{self.threads_per_child}}}"
+export HTTPD_SERVER_LIMIT="${{HTTPD_SERVER_LIMIT:-$((CORES * 2))}}"
+export HTTPD_START_SERVERS="${{HTTPD_START_SERVERS:-$CORES}}"
+export HTTPD_MAX_REQUEST_WORKERS="${{HTTPD_MAX_REQUEST_WORKERS:-$((HTTPD_SERVER_LIMIT * HTTPD_THREADS_PER_CHILD))}}"
+export HTTPD_MIN_SPARE_THREADS="${{HTTPD_MIN_SPARE_THREADS:-$HTTPD_THREADS_PER_CHILD}}"
+export HTTPD_MAX_SPARE_THREADS="${{HTTPD_MAX_SPARE_THREADS:-$((HTTPD_THREADS_PER_CHILD * (CORES + 1)))}}"
+
+exec httpd-foreground "$@"
+'''
+
+        with open(target_dir / "storefront-tuned.conf", "w") as f:
+            f.write(httpd_conf)
+
+        entrypoint_path = target_dir / "httpd-entrypoint.sh"
+        with open(entrypoint_path, "w", newline="\n") as f:
+            f.write(entrypoint)
+        entrypoint_path.chmod(0o755)
+
+        print(f"  ✓ Created {target_dir / 'storefront-tuned.conf'}")
+        print(f"  ✓ Created {entrypoint_path}")
+        return True
+
+    def create_nginx_config(self, target_dir):
+        """Create the complete nginx.conf"""
+        print("🟩 Creating nginx config...")
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        nginx_conf = f'''# nginx.conf - generated by tools/generate_server_configs.py
+user  nginx;
+worker_processes  auto;
+worker_rlimit_nofile  {self.worker_connections * 2};
+
+error_log  /var/log/nginx/error.log notice;
+pid        /var/run/nginx.pid;
+
+events {{
+    worker_connections  {self.worker_connections};
+    multi_accept        on;
+}}
+
+http {{
+    include       /etc/nginx/mime.types;
+    default_type  application/octet-stream;
+
+    access_log  /var/log/nginx/access.log combined buffer=64k flush=5s;
+
+    # Zero-copy static file serving, full packets, no Nagle delay
+    sendfile        on;
+    tcp_nopush      on;
+    tcp_nodelay     on;
+
+    keepalive_timeout   {self.keepalive_timeout}s;
+    keepalive_requests  {self.keepalive_requests};
+    server_tokens       off;
+
+    # Cache open file descriptors and stat() results
+    open_file_cache           max=10000 inactive=60s;
+    open_file_cache_valid     120s;
+    open_file_cache_min_uses  1;
+    open_file_cache_errors    on;
+
+    # Serve the build's .gz siblings; compress anything else on the fly
+    gzip_static      on;
+    gzip             on;
+    gzip_vary        on;
+    gzip_comp_level  5;
+    gzip_min_length  1024;
+    gzip_types       text/css application/javascript application/json image/svg+xml;
+
+    server {{
+        listen       80;
+        server_name  localhost;
+        root         /usr/share/nginx/html;
+        index        index.html;
+
+        # Fingerprinted assets never change
+        location /assets/ {{
+            add_header  Cache-Control "public, max-age={self.asset_max_age}, immutable";
+            access_log  off;
+            try_files   $uri =404;
+        }}
+
+        location /img/ {{
+            add_header  Cache-Control "public, max-age={self.image_max_age}";
+            access_log  off;
+            try_files   $uri =404;
+        }}
+
+        # The page itself is always revalidated so new asset hashes are picked up
+        location / {{
+            add_header  Cache-Control "no-cache";
+            try_files   $uri $uri/ /index.html;
+        }}
+    }}
+}}
+'''
+
+        with open(target_dir / "nginx.conf", "w") as f:
+            f.write(nginx_conf)
+
+        print(f"  ✓ Created {target_dir / 'nginx.conf'}")
+        return True
+
+
+def main():
+    """Main function to parse arguments and generate the configs"""
+    parser = argparse.ArgumentParser(
+        description="Generate tuned httpd and nginx configs for the storefront images",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                              # Regenerate with default settings
+  %(prog)s --keepalive-timeout 5        # Shorter idle keep-alive
+  %(prog)s --worker-connections 8192    # More connections per nginx worker
+        """
+    )
+    parser.add_argument("--keepalive-timeout", type=int, default=15,
+                        help="Idle keep-alive timeout in seconds (default: %(default)s)")
+    parser.add_argument("--keepalive-requests", type=int, default=1000,
+                        help="Requests per keep-alive connection (default: %(default)s)")
+    parser.add_argument("--worker-connections", type=int, default=4096,
+                        help="nginx connections per worker (default: %(default)s)")
+    parser.add_argument("--threads-per-child", type=int, default=64,
+                        help="httpd event MPM threads per child (default: %(default)s)")
+    args = parser.parse_args()
+
+    generator = ServerConfigGenerator(
+        keepalive_timeout=args.keepalive_timeout,
+        keepalive_requests=args.keepalive_requests,
+        worker_connections=args.worker_connections,
+        threads_per_child=args.threads_per_child
+    )
+    generator.create_httpd_config(REPO_ROOT / "Ecommerce" / "httpd")
+    generator.create_nginx_config(REPO_ROOT / "E-CommerceApp2" / "nginx")
+
+
+if __name__ == "__main__":
+    main()
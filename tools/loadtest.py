@@ -0,0 +1,149 @@
+# loadtest.py
+"""
+Compare requests/sec between storefront servers, e.g. stock vs tuned configs.
+
+Each target is hit for a fixed duration by several processes, each running
+a number of threads with their own keep-alive connection, cycling through
+the page and every asset it references (as a browser would fetch them).
+
+Example (stock images serve the same built files without the tuned config):
+
+  python tools/build_storefront.py E-CommerceApp2/index.html dist
+  docker run -d -p 8081:80 -v "$PWD/dist:/usr/share/nginx/html:ro" nginx
+  docker build -f E-CommerceApp2/Dockerfile -t ecommerce2 . && docker run -d -p 8082:80 ecommerce2
+  python tools/loadtest.py stock=http://localhost:8081 tuned=http://localhost:8082
+"""
+import argparse
+import http.client
+import multiprocessing
+import re
+import threading
+import time
+from urllib.parse import urlsplit
+
+ASSET_RE = re.compile(r'(?:href|src)="((?:assets|img)/[^"]+)"')
+
+
+def discover_paths(base_url):
+    """Return the page path plus every local asset it references"""
+    parts = urlsplit(base_url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=10)
+    conn.request("GET", "/", headers={"Accept-Encoding": "identity"})
+    body = conn.getresponse().read().decode("utf-8", "replace")
+    conn.close()
+    return ["/"] + [f"/{path}" for path in dict.fromkeys(ASSET_RE.findall(body))]
+
+
+def worker_process(args):
+    """Run `threads` keep-alive clients for `duration` seconds; return raw stats"""
+    base_url, paths, threads, duration, encoding = args
+    parts = urlsplit(base_url)
+    deadline = time.perf_counter() + duration
+    lock = threading.Lock()
+    totals = {"requests": 0, "errors": 0, "bytes": 0, "latencies": []}
+
+    def client(offset):
+        conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=10)
+        headers = {"Accept-Encoding": encoding, "Connection": "keep-alive"}
+        requests = errors = received = 0
+        latencies = []
+        index = offset
+        while time.perf_counter() < deadline:
+            path = paths[index % len(paths)]
+            index += 1
+            start = time.perf_counter()
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                received += len(response.read())
+                if response.status >= 400:
+                    errors += 1
+            except (OSError, http.client.HTTPException):
+                errors += 1
+                conn.close()
+                conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=10)
+                continue
+            requests += 1
+            if requests % 10 == 0:
+                latencies.append(time.perf_counter() - start)
+        conn.close()
+        with lock:
+            totals["requests"] += requests
+            totals["errors"] += errors
+            totals["bytes"] += received
+            totals["latencies"].extend(latencies)
+
+    workers = [threading.Thread(target=client, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return totals
+
+
+def run_target(name, base_url, processes, threads, duration, encoding):
+    paths = discover_paths(base_url)
+    print(f"🔥 {name}: {base_url} ({len(paths)} paths, {processes}x{threads} clients, {duration}s)")
+    with multiprocessing.Pool(processes) as pool:
+        results = pool.map(
+            worker_process, [(base_url, paths, threads, duration, encoding)] * processes
+        )
+
+    requests = sum(result["requests"] for result in results)
+    latencies = sorted(latency for result in results for latency in result["latencies"])
+
+    def percentile(fraction):
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000
+
+    return {
+        "name": name,
+        "rps": requests / duration,
+        "errors": sum(result["errors"] for result in results),
+        "mb_per_s": sum(result["bytes"] for result in results) / duration / 1e6,
+        "p50": percentile(0.50),
+        "p99": percentile(0.99),
+    }
+
+
+def main():
+    """Main function to parse arguments and run the comparison"""
+    parser = argparse.ArgumentParser(
+        description="Compare storefront server throughput in requests/sec",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s stock=http://localhost:8081 tuned=http://localhost:8082
+  %(prog)s tuned=http://localhost:8082 --duration 30 --threads 32
+        """
+    )
+    parser.add_argument("targets", nargs="+", help="name=url pairs to compare, in order")
+    parser.add_argument("--duration", type=int, default=15,
+                        help="Seconds per target (default: %(default)s)")
+    parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count(),
+                        help="Client processes (default: CPU count)")
+    parser.add_argument("--threads", type=int, default=16,
+                        help="Keep-alive clients per process (default: %(default)s)")
+    parser.add_argument("--encoding", default="br, gzip",
+                        help="Accept-Encoding header to send (default: %(default)s)")
+    args = parser.parse_args()
+
+    results = []
+    for target in args.targets:
+        name, _, url = target.partition("=")
+        if not url:
+            name = url = target
+        results.append(run_target(
+            name, url, args.processes, args.threads, args.duration, args.encoding
+        ))
+
+    baseline = results[0]["rps"] or 1
+    print(f"\n  {'target':<12} {'req/s':>10} {'vs first':>9} {'MB/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for result in results:
+        print(f"  {result['name']:<12} {result['rps']:>10,.0f} {result['rps'] / baseline:>8.2f}x "
+              f"{result['mb_per_s']:>8.1f} {result['p50']:>8.2f} {result['p99']:>8.2f} {result['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+# optimize_images.py
+"""
+Generate responsive image variants for the storefronts.
+
+Every image in the source directory is resized to a set of widths and
+written as WebP (and AVIF when Pillow supports it) plus one JPEG fallback.
+A tiny blurred WebP is embedded as a data URI to use as a placeholder while
+the real image loads. The results are recorded in manifest.json and, with
+--html, injected into a storefront page:
+
+  * the IMAGE_MANIFEST literal in the page script is replaced, so product
+    cards render <picture> elements with srcset/sizes for local variants;
+  * any <img data-image-key="KEY"> tag (e.g. the hero banner) is wrapped in
+    a <picture> with one <source> per format (AVIF first) and its src set to
+    the JPEG fallback; re-running replaces the <picture> instead of nesting.
+
+Name source files after the key the page looks up: product-<id>.jpg for
+products (or the product's imageKey) and e.g. hero.jpg for banners.
+
+Requires Pillow: pip install Pillow
+"""
+import argparse
+import base64
+import io
+import json
+import re
+import sys
+from pathlib import Path
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".tif", ".tiff"}
+FORMAT_PREFERENCE = ("avif", "webp")
+
+
+class ImageOptimizer:
+    def __init__(self, src_dir, out_dir, widths=(320, 480, 640, 960, 1280),
+                 url_prefix="img/", quality=75, formats=("avif", "webp")):
+        """
+        Initialize the image optimizer
+
+        Args:
+            src_dir: Directory with the original images
+            out_dir: Directory to write variants and manifest.json to
+            widths: Target widths in pixels (never upscaled)
+            url_prefix: URL path the page uses to reach out_dir
+            quality: Encoder quality for WebP/AVIF/JPEG
+            formats: Modern formats to generate, in order of preference
+        """
+        self.src_dir = Path(src_dir)
+        self.out_dir = Path(out_dir)
+        self.widths = sorted(set(widths))
+        self.url_prefix = url_prefix if url_prefix.endswith("/") else url_prefix + "/"
+        self.quality = quality
+        self.formats = [fmt for fmt in formats if self._supported(fmt)]
+        self.manifest = {}
+
+    @staticmethod
+    def _supported(fmt):
+        if features.check(fmt):
+            return True
+        print(f"  ⚠️  Pillow was built without {fmt.upper()} support, skipping {fmt}")
+        return False
+
+    def optimize(self):
+        """Process every image in the source directory"""
+        print(f"🖼️  Optimizing images in {self.src_dir}...")
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+
+        sources = sorted(
+            path for path in self.src_dir.iterdir()
+            if path.suffix.lower() in SOURCE_EXTENSIONS
+        )
+        if not sources:
+            print("  ✗ No source images found")
+            return False
+
+        original_bytes = 0
+        optimized_bytes = 0
+        for path in sources:
+            entry, before, after = self.process_image(path)
+            self.manifest[path.stem] = entry
+            original_bytes += before
+            optimized_bytes += after
+            print(f"  ✓ {path.name}: {before / 1024:.0f} KB -> "
+                  f"{after / 1024:.0f} KB at {entry['width']}px ({', '.join(self.formats)})")
+
+        self.write_manifest()
+        print(f"  ✓ {len(sources)} images, original {original_bytes / 1024:.0f} KB, "
+              f"largest variants {optimized_bytes / 1024:.0f} KB")
+        return True
+
+    def process_image(self, path):
+        """Write all variants of one image; return (manifest entry, bytes before, bytes after)"""
+        with Image.open(path) as original:
+            image = original.convert("RGB")
+
+        widths = [width for width in self.widths if width < image.width] or [image.width]
+        if image.width not in widths and image.width <= self.widths[-1]:
+            widths.append(image.width)
+
+        sources = {}
+        largest_sizes = []
+        for fmt in self.formats:
+            candidates = []
+            for width in widths:
+                name = f"{path.stem}-{width}.{fmt}"
+                size = self._save(self._resize(image, width), self.out_dir / name, fmt)
+                candidates.append(f"{self.url_prefix}{name} {width}w")
+            largest_sizes.append(size)
+            sources[fmt] = ", ".join(candidates)
+
+        # JPEG fallback near the typical card width for browsers without WebP
+        fallback_width = min(widths, key=lambda width: abs(width - 640))
+        fallback_name = f"{path.stem}-{fallback_width}.jpg"
+        self._save(self._resize(image, fallback_width), self.out_dir / fallback_name, "jpeg")
+
+        display = self._resize(image, widths[-1])
+        entry = {
+            "width": display.width,
+            "height": display.height,
+            "sources": sources,
+            "fallback": f"{self.url_prefix}{fallback_name}",
+            "placeholder": self.make_placeholder(image),
+        }
+        return entry, path.stat().st_size, min(largest_sizes, default=0)
+
+    @staticmethod
+    def _resize(image, width):
+        if width >= image.width:
+            return image
+        height = round(image.height * width / image.width)
+        return image.resize((width, height), Image.LANCZOS)
+
+    def _save(self, image, target, fmt):
+        options = {"quality": self.quality}
+        if fmt == "webp":
+            options["method"] = 6
+        elif fmt == "jpeg":
+            options.update(optimize=True, progressive=True)
+        image.save(target, fmt.upper(), **options)
+        return target.stat().st_size
+
+    @staticmethod
+    def make_placeholder(image, width=16):
+        """Return a tiny low-quality WebP data URI to show while the image loads"""
+        small = ImageOptimizer._resize(image, width)
+        buffer = io.BytesIO()
+        small.save(buffer, "WEBP", quality=30)
+        return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+    def write_manifest(self):
+        manifest_path = self.out_dir / "manifest.json"
+        with open(manifest_path, "w") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        print(f"  ✓ Wrote {manifest_path}")
+
+    def inject_manifest(self, html_path):
+        """Embed the manifest into a storefront page and rewrite keyed <img> tags"""
+        html_path = Path(html_path)
+        html = html_path.read_text()
+
+        literal = json.dumps(self.manifest, separators=(",", ":"), sort_keys=True)
+        html, count = re.subn(
+            r"/\* image-manifest \*/.*?/\* /image-manifest \*/",
+            lambda _: f"/* image-manifest */ {literal} /* /image-manifest */",
+            html, flags=re.S
+        )
+        if not count:
+            print(f"  ⚠️  No IMAGE_MANIFEST marker found in {html_path}")
+
+        def rewrite_img(match):
+            tag = match.group("img")
+            entry = self.manifest.get(match.group("key"))
+            if entry is None:
+                return match.group(0)
+            # From the <img>, or from the <source> tags of an earlier run
+            sizes = re.search(r'\ssizes="([^"]*)"', match.group(0))
+            sizes = sizes.group(1) if sizes else "100vw"
+            # Browsers take the first <source> type they support
+            formats = sorted(entry["sources"], key=lambda fmt: FORMAT_PREFERENCE.index(fmt))
+            sources = "".join(
+                f'<source type="image/{fmt}" srcset="{entry["sources"][fmt]}" sizes="{sizes}">'
+                for fmt in formats
+            )
+            tag = re.sub(r'\ssrc="[^"]*"', f' src="{entry["fallback"]}"', tag)
+            tag = re.sub(r'\s+(?:srcset|sizes)="[^"]*"', "", tag)
+            tag = re.sub(r'\swidth="\d+"', f' width="{entry["width"]}"', tag)
+            tag = re.sub(r'\sheight="\d+"', f' height="{entry["height"]}"', tag)
+            return f"<picture>{sources}{tag}</picture>"
+
+        html = re.sub(
+            r'(?:<picture>(?:<source\b[^>]*>)*)?'
+            r'(?P<img><img\b[^>]*\bdata-image-key="(?P<key>[^"]+)"[^>]*>)(?:</picture>)?',
+            rewrite_img, html
+        )
+        html_path.write_text(html)
+        print(f"  ✓ Injected {len(self.manifest)} image entries into {html_path}")
+        return True
+
+
+def main():
+    """Main function to parse arguments and run the optimizer"""
+    parser = argparse.ArgumentParser(
+        description="Generate responsive WebP/AVIF image variants for the storefronts",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s Ecommerce/images Ecommerce/img
+  %(prog)s E-CommerceApp2/images E-CommerceApp2/img --html E-CommerceApp2/index.html
+  %(prog)s images out --widths 400 800 --formats webp
+        """
+    )
+
+    parser.add_argument("src", help="Directory containing the original images")
+    parser.add_argument("out", help="Directory to write variants and manifest.json to")
+    parser.add_argument("--widths", type=int, nargs="+", default=[320, 480, 640, 960, 1280],
+                        help="Variant widths in pixels (default: %(default)s)")
+    parser.add_argument("--formats", nargs="+", default=["avif", "webp"], choices=["avif", "webp"],
+                        help="Modern formats to generate (default: %(default)s)")
+    parser.add_argument("--quality", type=int, default=75,
+                        help="Encoder quality (default: %(default)s)")
+    parser.add_argument("--url-prefix", default="img/",
+                        help="URL path of the output directory as seen by the page (default: %(default)s)")
+    parser.add_argument("--html", action="append", default=[],
+                        help="Storefront page to inject the manifest into (repeatable)")
+
+    args = parser.parse_args()
+
+    if Image is None:
+        print("❌ Pillow is required: pip install Pillow")
+        sys.exit(1)
+
+    optimizer = ImageOptimizer(
+        args.src, args.out,
+        widths=args.widths,
+        url_prefix=args.url_prefix,
+        quality=args.quality,
+        formats=args.formats
+    )
+    if not optimizer.optimize():
+        sys.exit(1)
+
+    for html_path in args.html:
+        optimizer.inject_manifest(html_path)
+
+
+if __name__ == "__main__":
+    main()